@@ -1,42 +1,24 @@
-from src.storage.graph import GraphStore
+from functools import cache
+from src.storage.graph import get_graph_store
 from src.storage.vector import VectorStore
 from src.storage.postgres import AuditStore
 from src.pipeline.extractor import Extractor
 from src.pipeline.resolver import EntityResolver
 
-# Singleton instances
-_graph_store = None
-_vector_store = None
-_audit_store = None
-_extractor = None
-_resolver = None
-
-def get_graph_store() -> GraphStore:
-    global _graph_store
-    if _graph_store is None:
-        _graph_store = GraphStore()
-    return _graph_store
+# Singleton instances: built on first call, then served from the cache
 
+@cache
 def get_vector_store() -> VectorStore:
-    global _vector_store
-    if _vector_store is None:
-        _vector_store = VectorStore()
-    return _vector_store
+    return VectorStore()
 
+@cache
 def get_audit_store() -> AuditStore:
-    global _audit_store
-    if _audit_store is None:
-        _audit_store = AuditStore()
-    return _audit_store
+    return AuditStore()
 
+@cache
 def get_extractor() -> Extractor:
-    global _extractor
-    if _extractor is None:
-        _extractor = Extractor()
-    return _extractor
+    return Extractor()
 
+@cache
 def get_resolver() -> EntityResolver:
-    global _resolver
-    if _resolver is None:
-        _resolver = EntityResolver()
-    return _resolver
+    return EntityResolver()
@@ -8,6 +8,7 @@ from src.pipeline.extractor import Extractor
 from src.pipeline.resolver import EntityResolver
 from src.ingestion.tasks import ingest_url
 from src.core.logging import get_logger
+import asyncio
 import random
 import hashlib
 from geopy.geocoders import Nominatim
@@ -127,10 +128,10 @@ async def search_endpoint(
 async def status_endpoint():
     return {"status": "ok", "version": "4.0.0"}
 
-@router.get("/graph/geo")
-async def get_geo_graph(graph_store: GraphStore = Depends(get_graph_store)):
+def _fetch_geo_flows(graph_store: GraphStore) -> List[Dict[str, Any]]:
     """
-    Fetch geospatial supply chain flows from Neo4j.
+    Blocking part of /graph/geo: Neo4j query plus geocoding of each flow.
+    Run off the event loop (see get_geo_graph).
     """
     query = """
     MATCH (buyer:ORGANIZATION)-[r1]->(supplier:ORGANIZATION)
@@ -138,38 +139,51 @@ async def get_geo_graph(graph_store: GraphStore = Depends(get_graph_store)):
     RETURN buyer.name as buyer, supplier.name as supplier, country.name as location, type(r1) as relation
     LIMIT 100
     """
-    
+
+    # Materialize the rows and release the session before geocoding:
+    # streaming would keep a pooled connection busy across slow Nominatim calls.
+    with graph_store.driver.session() as session:
+        records = session.run(query).data()
+
+    flows = []
+    for record in records:
+        buyer = record["buyer"]
+        supplier = record["supplier"]
+        location = record["location"] if record["location"] else "UNKNOWN"
+        relation = record["relation"]
+        
+        # Resolve Coordinates
+        supplier_coords = get_coordinates(location)
+        
+        # Try to find buyer location (default to Paris/Safran if unknown)
+        # Ideally we would query the buyer's location too, but for now:
+        if "SAFRAN" in buyer.upper():
+            buyer_coords = GEO_MAPPING["SAFRAN"]
+        else:
+            buyer_coords = get_coordinates(buyer) # Try to geocode the buyer name itself
+        
+        # Determine Risk
+        risk = "HIGH" if "DEPENDS" in relation or "OPPOSES" in relation else "MEDIUM"
+        
+        flows.append({
+            "buyer": buyer,
+            "supplier": supplier,
+            "from": supplier_coords,
+            "to": buyer_coords,
+            "risk": risk
+        })
+
+    return flows
+
+@router.get("/graph/geo")
+async def get_geo_graph(graph_store: GraphStore = Depends(get_graph_store)):
+    """
+    Fetch geospatial supply chain flows from Neo4j.
+    """
     try:
-        flows = []
-        with graph_store.driver.session() as session:
-            result = session.run(query)
-            
-            for record in result:
-                buyer = record["buyer"]
-                supplier = record["supplier"]
-                location = record["location"] if record["location"] else "UNKNOWN"
-                relation = record["relation"]
-                
-                # Resolve Coordinates
-                supplier_coords = get_coordinates(location)
-                
-                # Try to find buyer location (default to Paris/Safran if unknown)
-                # Ideally we would query the buyer's location too, but for now:
-                if "SAFRAN" in buyer.upper():
-                    buyer_coords = GEO_MAPPING["SAFRAN"]
-                else:
-                    buyer_coords = get_coordinates(buyer) # Try to geocode the buyer name itself
-                
-                # Determine Risk
-                risk = "HIGH" if "DEPENDS" in relation or "OPPOSES" in relation else "MEDIUM"
-                
-                flows.append({
-                    "buyer": buyer,
-                    "supplier": supplier,
-                    "from": supplier_coords,
-                    "to": buyer_coords,
-                    "risk": risk
-                })
+        # The Neo4j driver and Nominatim are both synchronous; running them in a
+        # worker thread keeps the event loop free for other requests meanwhile.
+        flows = await asyncio.to_thread(_fetch_geo_flows, graph_store)
         
         return {
             "count": len(flows),
@@ -1,5 +1,8 @@
+from functools import lru_cache
+from types import MappingProxyType
+from pydantic import field_serializer, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 class Settings(BaseSettings):
     # Environment
@@ -11,6 +14,7 @@ class Settings(BaseSettings):
     NEO4J_USER: str = "neo4j"
     NEO4J_PASSWORD: str = "password"
     NEO4J_DATABASE: str = "neo4j"
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = 100
     
     QDRANT_URL: str = "http://localhost:6333"
     QDRANT_COLLECTION: str = "shadowmap_entities"
@@ -36,7 +40,7 @@ class Settings(BaseSettings):
     API_PORT: int = 8000
 
     # Scoring Weights
-    SOURCE_WEIGHTS: Dict[str, float] = {
+    SOURCE_WEIGHTS: Mapping[str, float] = {
         "reuters.com": 0.95,
         "apnews.com": 0.95,
         "nytimes.com": 0.90,
@@ -47,7 +51,7 @@ class Settings(BaseSettings):
         "DEFAULT": 0.50
     }
     
-    METHOD_WEIGHTS: Dict[str, float] = {
+    METHOD_WEIGHTS: Mapping[str, float] = {
         "gpt-4o": 0.90,
         "gpt-4-turbo": 0.85,
         "gemini-1.5-flash": 0.85,
@@ -58,7 +62,7 @@ class Settings(BaseSettings):
     }
 
     # Entity Resolution Thresholds
-    MERGE_THRESHOLDS: Dict[str, float] = {
+    MERGE_THRESHOLDS: Mapping[str, float] = {
         "PERSON": 0.92,
         "ORGANIZATION": 0.90,
         "LOCATION": 0.95,
@@ -75,4 +79,19 @@ class Settings(BaseSettings):
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
-settings = Settings()
+    @field_validator("SOURCE_WEIGHTS", "METHOD_WEIGHTS", "MERGE_THRESHOLDS", mode="after")
+    @classmethod
+    def _freeze_weights(cls, v: Mapping[str, float]) -> Mapping[str, float]:
+        """Weight tables are read per claim/entity and must never be mutated at runtime."""
+        return MappingProxyType(dict(v))
+
+    @field_serializer("SOURCE_WEIGHTS", "METHOD_WEIGHTS", "MERGE_THRESHOLDS")
+    def _dump_weights(self, v: Mapping[str, float]) -> Dict[str, float]:
+        return dict(v)
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build (read .env + validate) the Settings once per process."""
+    return Settings()
+
+settings = get_settings()
@@ -1,6 +1,9 @@
 from typing import List
 import re
 
+# Compiled once at import; chunk() runs on every ingested document
+_NEWLINES_RE = re.compile(r'\n+')
+
 class SemanticChunker:
     """
     Splits text into semantic chunks suitable for embedding and LLM processing.
@@ -22,7 +25,7 @@ class SemanticChunker:
             
         # 1. First, split by something reasonable (newlines)
         # We replace multiple newlines with a unique delimiter to split safely
-        text = re.sub(r'\n+', '\n', text) # Normalize to single newlines
+        text = _NEWLINES_RE.sub('\n', text) # Normalize to single newlines
         paragraphs = text.split('\n')
         
         chunks = []
@@ -1,8 +1,10 @@
 import time
 import random
 import json
+import re
+import redis
 import google.generativeai as genai
-from typing import List, Dict
+from typing import List, Dict, Optional
 from duckduckgo_search import DDGS
 from src.core.logging import get_logger
 from src.ingestion.tasks import ingest_url
@@ -10,6 +12,9 @@ from src.config import settings
 
 logger = get_logger(__name__)
 
+# Matches the JSON list of queries inside a (possibly chatty) LLM reply
+_JSON_LIST_RE = re.compile(r'\[.*\]', re.DOTALL)
+
 # Configure Gemini
 if settings.GEMINI_API_KEY:
     genai.configure(api_key=settings.GEMINI_API_KEY)
@@ -26,11 +31,36 @@ class DiscoveryEngine:
         self.max_depth = 2  # Strict limit for demo/prototype
         self.max_results = 2 # Keep it focused
         self.model = genai.GenerativeModel(settings.GEMINI_MODEL)
+        # Generated queries are memoized per entity: the same organization shows up
+        # in many chunks, and each miss costs a Gemini call.
+        self.redis = redis.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=2)
+        self.query_cache_ttl = 86400  # 1 day
+
+    def _get_cached_queries(self, cache_key: str) -> Optional[List[str]]:
+        """Read memoized queries. A Redis outage must not block discovery."""
+        try:
+            cached = self.redis.get(cache_key)
+        except redis.RedisError as e:
+            logger.warning("query_cache_read_failed", error=str(e))
+            return None
+        return json.loads(cached) if cached else None
+
+    def _cache_queries(self, cache_key: str, queries: List[str]):
+        try:
+            self.redis.set(cache_key, json.dumps(queries), ex=self.query_cache_ttl)
+        except redis.RedisError as e:
+            logger.warning("query_cache_write_failed", error=str(e))
 
     def generate_multilingual_queries(self, entity_name: str) -> List[str]:
         """
         Uses LLM to detect entity origin and generate localized search queries.
         """
+        cache_key = f"discovery:queries:{entity_name.strip().lower()}"
+        cached = self._get_cached_queries(cache_key)
+        if cached is not None:
+            logger.info("multilingual_queries_cache_hit", entity=entity_name)
+            return cached
+
         try:
             prompt = f"""
             You are an expert OSINT investigator. 
@@ -59,8 +89,7 @@ class DiscoveryEngine:
             text = response.text.strip()
             
             # Clean up potential markdown formatting
-            import re
-            match = re.search(r'\[.*\]', text, re.DOTALL)
+            match = _JSON_LIST_RE.search(text)
             if match:
                 json_str = match.group(0)
                 queries = json.loads(json_str)
@@ -70,6 +99,8 @@ class DiscoveryEngine:
             
             # Log the detection (inferring from the first query characters or just generic log)
             logger.info("generated_multilingual_queries", entity=entity_name, queries=queries)
+            # Only LLM results are cached; the fallback below is cheap and should be retried
+            self._cache_queries(cache_key, queries)
             return queries
 
         except Exception as e:
@@ -1,4 +1,5 @@
 import os
+import re
 import json
 from typing import List, Dict, Any
 import google.generativeai as genai
@@ -11,6 +12,9 @@ logger = get_logger(__name__)
 
 from src.config import settings
 
+# Payload of a Markdown code fence (```json ... ``` or ``` ... ```) in an LLM reply
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
+
 class Extractor:
     """
     Hybrid extraction engine using Google Gemini.
@@ -53,11 +57,10 @@ class Extractor:
             # Nettoyage de la réponse brute de Gemini
             raw_text = response.text.strip()
             
-            # Si Gemini a mis des balises Markdown ```json ... ```, on les enlève
-            if raw_text.startswith("```json"):
-                raw_text = raw_text.replace("```json", "").replace("```", "")
-            elif raw_text.startswith("```"):
-                raw_text = raw_text.replace("```", "")
+            # Si Gemini a mis des balises Markdown ```json ... ```, on ne garde que leur contenu
+            match = _JSON_FENCE_RE.search(raw_text)
+            if match:
+                raw_text = match.group(1)
                 
             # Maintenant on peut charger le JSON propre
             extracted_data = json.loads(raw_text)
@@ -85,6 +88,13 @@ class Extractor:
                 )
                 entities.append(entity)
                 
+            # Calculate confidence once: every claim in a chunk shares source, model and count
+            score = ConfidenceCalculator.compute(
+                source_domain=source_domain,
+                method=self.model_name,
+                corroboration_count=1
+            )
+            
             # Process Claims
             for claim_data in extracted_data.get("claims", []):
                 subj_name = claim_data.get('subject')
@@ -96,13 +106,6 @@ class Extractor:
                 
                 # Only keep claim if both endpoints are known entities
                 if subj_id and obj_id:
-                    # Calculate confidence
-                    score = ConfidenceCalculator.compute(
-                        source_domain=source_domain,
-                        method=self.model_name,
-                        corroboration_count=1
-                    )
-                    
                     claim = Claim(
                         source_id=claim_data.get("source_id", "00000000-0000-0000-0000-000000000000"), # Placeholder
                         source_url="http://placeholder.url", # Placeholder
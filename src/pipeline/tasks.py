@@ -1,14 +1,31 @@
 from celery import shared_task
 import uuid
 import hashlib
+from functools import cache, lru_cache
 import google.generativeai as genai
 from src.pipeline.extractor import Extractor
 from src.core.logging import get_logger
-from src.storage.graph import GraphStore
+from src.storage.graph import get_graph_store
 from src.storage.vector import VectorStore
 
 logger = get_logger(__name__)
 
+# Worker-level singletons, reused across tasks instead of rebuilt per chunk
+@cache
+def _get_extractor() -> Extractor:
+    return Extractor()
+
+@cache
+def _get_vector_store() -> VectorStore:
+    return VectorStore()
+
+@cache
+def _get_discovery():
+    # Imported lazily: discovery imports the ingestion tasks module
+    from src.pipeline.discovery import DiscoveryEngine
+    return DiscoveryEngine()
+
+@lru_cache(maxsize=4096)
 def generate_uuid_from_string(val: str) -> str:
     """Generate a deterministic UUID from a string."""
     hex_string = hashlib.md5(val.encode("UTF-8")).hexdigest()
@@ -23,7 +40,7 @@ def extract_claims(self, text: str, source_domain: str, source_id: str, depth: i
     
     try:
         # 1. Extract
-        extractor = Extractor()
+        extractor = _get_extractor()
         data = extractor.extract(text=text, source_domain=source_domain)
         
         entities = data.get("entities", [])
@@ -32,35 +49,34 @@ def extract_claims(self, text: str, source_domain: str, source_id: str, depth: i
         logger.info("extraction_success", entities=len(entities), claims=len(claims))
         
         # 2. Save to Graph (Neo4j)
-        graph_store = GraphStore()
+        graph_store = get_graph_store()
         graph_store.merge_entities_batch(entities)
         graph_store.merge_claims_batch(claims)
              
         # 3. Save to Vector DB (Qdrant)
-        vector_store = VectorStore()
+        vector_store = _get_vector_store()
         vector_data = []
-        
-        for entity in entities:
-             # Generate real embedding using Gemini
-             # Model: "models/text-embedding-004" is standard for Gemini
-             try:
-                 embedding_result = genai.embed_content(
+
+        if entities:
+            # Generate real embeddings using Gemini
+            # Model: "models/text-embedding-004" is standard for Gemini
+            # One batched call for the whole chunk instead of one round-trip per entity
+            try:
+                embedding_result = genai.embed_content(
                     model="models/text-embedding-004",
-                    content=entity.canonical_name,
+                    content=[entity.canonical_name for entity in entities],
                     task_type="retrieval_document"
-                 )
-                 vector = embedding_result['embedding']
-                 
-                 # Ensure ID is UUID
-                 entity_uuid = generate_uuid_from_string(entity.id)
-                 
-                 vector_data.append({
-                     "id": entity_uuid,
-                     "vector": vector, 
-                     "payload": entity.model_dump()
-                 })
-             except Exception as embed_err:
-                 logger.error("embedding_failed", entity=entity.canonical_name, error=str(embed_err))
+                )
+
+                for entity, vector in zip(entities, embedding_result['embedding']):
+                    vector_data.append({
+                        # Ensure ID is UUID
+                        "id": generate_uuid_from_string(entity.id),
+                        "vector": vector,
+                        "payload": entity.model_dump()
+                    })
+            except Exception as embed_err:
+                logger.error("embedding_failed", entities=len(entities), error=str(embed_err))
 
         if vector_data:
             # Note: The vector config in vector.py must match the size of text-embedding-004 (768 dimensions)
@@ -75,8 +91,7 @@ def extract_claims(self, text: str, source_domain: str, source_id: str, depth: i
         
         # 4. Recursive Discovery Trigger
         # Only trigger if we haven't reached max depth
-        from src.pipeline.discovery import DiscoveryEngine
-        discovery = DiscoveryEngine()
+        discovery = _get_discovery()
         
         for entity in entities:
             if entity.entity_type == "ORGANIZATION":
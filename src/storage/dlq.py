@@ -1,4 +1,5 @@
 import traceback
+from functools import cache
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from src.config import settings
@@ -83,11 +84,7 @@ class DLQHandler:
             # If DLQ fails, we are in a very bad state. Log to stderr/file as last resort.
             raise DLQError(f"Failed to write to DLQ: {e}")
 
-_dlq_instance = None
-
+@cache
 def get_dlq():
     """Singleton accessor for DLQHandler."""
-    global _dlq_instance
-    if _dlq_instance is None:
-        _dlq_instance = DLQHandler()
-    return _dlq_instance
+    return DLQHandler()
@@ -1,3 +1,4 @@
+from functools import cache
 from neo4j import GraphDatabase
 from typing import List
 from src.config import settings
@@ -16,8 +17,22 @@ class GraphStore:
     def __init__(self):
         self.driver = GraphDatabase.driver(
             settings.NEO4J_URI, 
-            auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
+            auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+            max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE
         )
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """
+        Idempotent index creation.
+        Every batch write MERGEs / MATCHes on Entity.id; without an index each row is a label scan.
+        """
+        try:
+            with self.driver.session() as session:
+                session.run("CREATE INDEX entity_id IF NOT EXISTS FOR (e:Entity) ON (e.id)")
+        except Exception as e:
+            logger.error("neo4j_index_creation_failed", error=str(e))
+            # Don't raise: writes still work (just slower) without the index
 
     def close(self):
         self.driver.close()
@@ -94,3 +109,8 @@ class GraphStore:
         except Exception as e:
             logger.error("neo4j_batch_error", error=str(e))
             raise StorageError(f"Failed to merge claims batch: {e}")
+
+@cache
+def get_graph_store() -> GraphStore:
+    """Singleton accessor for GraphStore (one driver / connection pool per process)."""
+    return GraphStore()
@@ -43,3 +43,17 @@ class TestGraphPerformance:
         assert len(params['entities']) == 1000
         
         print(f"Batch processing time (mocked): {end_time - start_time:.4f}s")
+
+    @patch('src.storage.graph.GraphDatabase')
+    def test_entity_id_index_created(self, mock_graph_db):
+        """MERGE/MATCH on Entity.id must be index-backed, not a label scan."""
+        mock_driver = MagicMock()
+        mock_graph_db.driver.return_value = mock_driver
+        mock_session = MagicMock()
+        mock_driver.session.return_value.__enter__.return_value = mock_session
+        
+        GraphStore()
+        
+        query = mock_session.run.call_args[0][0]
+        assert "CREATE INDEX entity_id IF NOT EXISTS" in query
+        assert "(e.id)" in query
@@ -0,0 +1,56 @@
+import json
+import pytest
+import redis
+from unittest.mock import MagicMock, patch
+from src.pipeline.discovery import DiscoveryEngine
+
+class TestQueryCache:
+
+    @pytest.fixture
+    def engine(self):
+        with patch('src.pipeline.discovery.DDGS'), \
+             patch('src.pipeline.discovery.genai'), \
+             patch('src.pipeline.discovery.redis.Redis'):
+            engine = DiscoveryEngine()
+        engine.model.generate_content.return_value = MagicMock(text='["Airbus fournisseurs"]')
+        return engine
+
+    def test_cache_hit_skips_llm(self, engine):
+        """Requêtes en cache → pas d'appel Gemini."""
+        engine.redis.get.return_value = json.dumps(["cached query"])
+
+        queries = engine.generate_multilingual_queries("  Airbus ")
+
+        assert queries == ["cached query"]
+        engine.redis.get.assert_called_once_with("discovery:queries:airbus")
+        engine.model.generate_content.assert_not_called()
+
+    def test_cache_miss_stores_llm_result(self, engine):
+        """Cache vide → appel Gemini puis mise en cache 24h."""
+        engine.redis.get.return_value = None
+
+        queries = engine.generate_multilingual_queries("Airbus")
+
+        assert queries == ["Airbus fournisseurs"]
+        engine.redis.set.assert_called_once_with(
+            "discovery:queries:airbus", json.dumps(queries), ex=86400
+        )
+
+    def test_redis_down_falls_through(self, engine):
+        """Redis indisponible → la découverte continue sans cache."""
+        engine.redis.get.side_effect = redis.ConnectionError("down")
+        engine.redis.set.side_effect = redis.ConnectionError("down")
+
+        queries = engine.generate_multilingual_queries("Airbus")
+
+        assert queries == ["Airbus fournisseurs"]
+
+    def test_fallback_not_cached(self, engine):
+        """Échec LLM → requêtes de repli, non mises en cache."""
+        engine.redis.get.return_value = None
+        engine.model.generate_content.side_effect = Exception("quota")
+
+        queries = engine.generate_multilingual_queries("Airbus")
+
+        assert queries[0] == "Airbus major suppliers list"
+        engine.redis.set.assert_not_called()
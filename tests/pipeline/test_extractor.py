@@ -0,0 +1,33 @@
+import pytest
+from unittest.mock import MagicMock
+from src.pipeline.extractor import Extractor
+
+PAYLOAD = '{"entities": [{"name": "Airbus", "type": "ORGANIZATION"}], "claims": []}'
+
+class TestExtractorResponseParsing:
+
+    @pytest.fixture
+    def extractor(self):
+        extractor = Extractor()
+        extractor.api_key = "test-key"
+        extractor.model = MagicMock()
+        return extractor
+
+    def _reply(self, extractor, text):
+        extractor.model.generate_content.return_value = MagicMock(text=text)
+        return extractor.extract("Airbus builds aircraft.", "reuters.com")
+
+    def test_raw_json(self, extractor):
+        """JSON brut sans balises."""
+        result = self._reply(extractor, PAYLOAD)
+        assert [e.canonical_name for e in result["entities"]] == ["Airbus"]
+
+    def test_json_fence(self, extractor):
+        """Bloc ```json ... ``` → contenu extrait."""
+        result = self._reply(extractor, f"```json\n{PAYLOAD}\n```")
+        assert [e.canonical_name for e in result["entities"]] == ["Airbus"]
+
+    def test_fence_after_preamble(self, extractor):
+        """Texte avant le bloc ``` → ignoré."""
+        result = self._reply(extractor, f"Here is the extraction:\n```\n{PAYLOAD}\n```\nDone.")
+        assert [e.canonical_name for e in result["entities"]] == ["Airbus"]